@@ -0,0 +1,99 @@
+import threading
+
+import numpy as np
+import sounddevice as sd
+
+# Extra time over the clip length before playback is treated as stalled
+PLAYBACK_TIMEOUT_MARGIN = 2.0
+
+
+class AudioPlayer:
+    """Play utterances through one persistent output stream."""
+
+    def __init__(self, samplerate, blocksize=1024):
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self._stream = None
+        self._lock = threading.Lock()
+        self._audio = None
+        self._position = 0
+        self._status = None
+        self._done = threading.Event()
+        self._done.set()
+
+    def _callback(self, outdata, frames, time, status):
+        with self._lock:
+            if status:
+                self._status = status
+            if self._audio is None:
+                outdata.fill(0)
+                return
+
+            chunk = self._audio[self._position : self._position + frames]
+            outdata[: len(chunk), 0] = chunk
+            outdata[len(chunk) :] = 0
+            self._position += len(chunk)
+            if self._position >= len(self._audio):
+                self._audio = None
+                self._done.set()
+
+    def _finished_callback(self):
+        # The stream stopped or was aborted; release a waiting play()
+        self._done.set()
+
+    def _open_stream(self):
+        if self._stream is not None and not self._stream.active:
+            self._close_stream()
+        if self._stream is None:
+            self._stream = sd.OutputStream(
+                samplerate=self.samplerate,
+                blocksize=self.blocksize,
+                channels=1,
+                dtype="float32",
+                callback=self._callback,
+                finished_callback=self._finished_callback,
+            )
+            self._stream.start()
+
+    def _close_stream(self):
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.close()
+            except sd.PortAudioError:
+                pass
+
+    def play(self, audio):
+        """Play audio and wait until it ends or is stopped."""
+        self._open_stream()
+
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        with self._lock:
+            self._audio = audio
+            self._position = 0
+            self._status = None
+            self._done.clear()
+
+        timeout = len(audio) / self.samplerate + PLAYBACK_TIMEOUT_MARGIN
+        finished = self._done.wait(timeout)
+        with self._lock:
+            unfinished = self._audio is audio
+            self._audio = None
+            status = self._status
+        if unfinished:
+            # The device stopped calling back; the next play() reopens it
+            self._done.set()
+            self._close_stream()
+            reason = "timed out" if not finished else "stream stopped"
+            raise sd.PortAudioError(
+                f"Playback {reason}" + (f" ({status})" if status else "")
+            )
+
+    def stop(self):
+        with self._lock:
+            self._audio = None
+            self._done.set()
+
+    def close(self):
+        self.stop()
+        self._close_stream()
@@ -1,6 +1,16 @@
 APP_NAME = "FJ Chat to Speech"
 PADDING = 20
 DEFAULT_BUFFER_SIZE = 5
+MAX_LOG_MESSAGES = 1000
+MAX_PROCESSED_MESSAGES = 10000
+DETOX_BATCH_SIZE = 8
+# Messages waiting for the toxicity check before bursts are dropped
+MSG_BUFFER_SIZE = DETOX_BATCH_SIZE * 4
+# Upper bound on how much longer a message can get after translation
+TRANSLATION_GROWTH = 2
+SAMPLE_RATE = 48000
+TTS_CACHE_BYTES = 64 * 1024 * 1024
+TTS_CACHE_MAX_TEXT = 512
 VOICES = {
     "ru": ("xenia", "aidar", "baya", "kseniya", "eugene"),
     "en": (
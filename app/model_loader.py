@@ -0,0 +1,24 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from app.translations import translate_text
+
+
+class ModelLoader(QThread):
+    """Run a blocking model load outside of the GUI thread."""
+
+    loaded_signal = pyqtSignal(object)  # loaded model
+    error_signal = pyqtSignal(str)  # translated error text
+
+    def __init__(self, load, lang="en", parent=None):
+        super().__init__(parent)
+        self.load = load
+        self.lang = lang
+        self.finished.connect(self.deleteLater)
+
+    def run(self):
+        try:
+            model = self.load()
+        except Exception as e:
+            self.error_signal.emit(translate_text(str(e), self.lang))
+            return
+        self.loaded_signal.emit(model)
@@ -5,6 +5,7 @@ class MessageStatsTD(TypedDict):
     messages_count: int
     spoken_count: int
     spam_count: int
+    dropped_count: int
 
 
 class TwitchCredentialsTD(TypedDict):
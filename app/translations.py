@@ -1,10 +1,15 @@
 import asyncio
 import inspect
 import locale
-import multiprocessing
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
 from googletrans import Translator
 
+TRANSLATE_TIMEOUT = 10
+TRANSLATION_CACHE_SIZE = 8192
+
 TRANSLATIONS = {
     "en": {
         "app_title": "FJ Chat Voice - Silero TTS",
@@ -66,6 +71,7 @@ TRANSLATIONS = {
         "error_fetch_messages": "Error fetching messages",
         "Audio queue error": "Audio queue error",
         "Audio playback error": "Audio playback error",
+        "Message processing error": "Message processing error",
         "point": "point",
         "api_keys_help_text": "Creating and viewing API keys is available at the link",
         "not_determine_video_id": "Could not determine video ID",
@@ -142,6 +148,7 @@ TRANSLATIONS = {
         "error_fetch_messages": "Ошибка при получении сообщений",
         "Audio queue error": "Ошибка очереди аудио",
         "Audio playback error": "Ошибка воспроизведения аудио",
+        "Message processing error": "Ошибка обработки сообщения",
         "Error convert text to speech": "Ошибка конвертирования текста в речь",
         "point": "точка",
         "English": "Английский",
@@ -220,6 +227,7 @@ TRANSLATIONS = {
         "List of banned": "Список заблокированных",
         "The number of toxic messages leading to ban": "Количество токсичных сообщений для блокировки",
         "Banned": "Заблокирован",
+        "Unchecked": "Не проверено",
     },
 }
 
@@ -328,35 +336,94 @@ def transliteration(text: str, lang: str) -> str:
     return src
 
 
+@lru_cache(maxsize=1024)
 def _(lang, key):
     """Simple translation helper"""
     return TRANSLATIONS.get(lang, {}).get(key, key)
 
 
-def _proc_translate_external(q, txt, dst):
-    """Module-level worker for multiprocessing spawn on Windows."""
+_translator = None
+_translator_loop = None
+_translator_loop_lock = threading.Lock()
+_translation_cache = OrderedDict()
+_translation_cache_lock = threading.Lock()
+
+
+def _get_translator_loop():
+    """Event loop thread shared by all translations."""
+    global _translator_loop
+    with _translator_loop_lock:
+        if _translator_loop is None:
+            _translator_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_translator_loop.run_forever, name="translator", daemon=True
+            ).start()
+    return _translator_loop
+
+
+async def _translate_one(text, dest):
+    """Translate one text, or return None if it fails or times out."""
+    global _translator
+    if _translator is None:
+        _translator = Translator()
     try:
-        tr = Translator()
-        r = tr.translate(txt, dest=dst)
-        if inspect.isawaitable(r):
-            r = asyncio.run(r)
-        q.put(getattr(r, "text", txt))
-    except Exception as e:
-        try:
-            q.put({"__err__": str(e)})
-        except Exception:
-            pass
+        result = _translator.translate(text, dest=dest)
+        if inspect.isawaitable(result):
+            result = await asyncio.wait_for(result, TRANSLATE_TIMEOUT)
+        return result.text
+    except Exception:
+        return None
 
 
-def translate_text(text, dest):
+async def _translate_async(texts, dest):
+    # googletrans sends one request per text, so run them concurrently
+    return await asyncio.gather(*(_translate_one(text, dest) for text in texts))
+
+
+def translate_texts(texts, dest):
+    """Translate several texts concurrently, reusing cached results."""
+    results = list(texts)
+    with _translation_cache_lock:
+        missing = []
+        for index, text in enumerate(texts):
+            cached = _translation_cache.get((text, dest)) if text else text
+            if cached is None:
+                missing.append(index)
+            else:
+                results[index] = cached
+    if not missing:
+        return results
+
     try:
-        q = multiprocessing.Queue()
-        _proc_translate_external(q, text, dest)
-        return q.get_nowait()
+        future = asyncio.run_coroutine_threadsafe(
+            _translate_async([texts[i] for i in missing], dest),
+            _get_translator_loop(),
+        )
+        # Each request has its own timeout; this only guards the loop itself
+        translated = future.result(timeout=TRANSLATE_TIMEOUT + 1)
+    except TimeoutError:
+        # Stop the requests so a slow backend cannot pile them up on the loop
+        future.cancel()
+        return results
     except Exception as e:
         # self.add_sys_message(
         #     author="_translate_text()",
         #     text=f"{_(self.language, 'Failed to translate text')}. {e}",
         #     status="error",
         # )
-        return text
+        return results
+
+    with _translation_cache_lock:
+        for index, text in zip(missing, translated):
+            # Failed items keep the original text and are retried next time
+            if text is None:
+                continue
+            results[index] = text
+            _translation_cache[(texts[index], dest)] = text
+        while len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+            _translation_cache.popitem(last=False)
+    return results
+
+
+def translate_text(text, dest):
+    return translate_texts([text], dest)[0]
@@ -8,6 +8,8 @@ import requests
 
 from app.translations import _, translate_text
 
+_PRIVMSG_RE = re.compile(r":(\w+)!\w+@\w+\.tmi\.twitch\.tv PRIVMSG #\w+ :(.*)")
+
 
 class TwitchChatListener:
     def __init__(
@@ -248,9 +250,7 @@ class TwitchChatListener:
                         )
                         tag_dict[key] = value
 
-                match = re.search(
-                    r":(\w+)!\w+@\w+\.tmi\.twitch\.tv PRIVMSG #\w+ :(.*)", rest
-                )
+                match = _PRIVMSG_RE.search(rest)
 
                 if match:
                     username = match.group(1)
@@ -273,9 +273,7 @@ class TwitchChatListener:
                         "tags": tag_dict,
                     }
             else:
-                match = re.search(
-                    r":(\w+)!\w+@\w+\.tmi\.twitch\.tv PRIVMSG #\w+ :(.*)", line
-                )
+                match = _PRIVMSG_RE.search(line)
                 if match:
                     username = match.group(1)
                     message = match.group(2)
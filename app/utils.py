@@ -1,11 +1,12 @@
 import colorsys
 from functools import lru_cache
-import hashlib
 import os
 import platform
 import re
 import sys
+import zlib
 
+from num2words import num2words
 from torch import hub
 
 from app.constants import APP_NAME
@@ -41,6 +42,14 @@ def resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 
+def atomic_write(path: str, text: str):
+    """Write text to a temporary file and swap it into place."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
 def icon_path():
     if platform.system() == "Windows":
         return "img/icon.ico"
@@ -185,6 +194,36 @@ def clear_detoxify_checkpoint_cache(model_type="multilingual"):
             pass
 
 
+_NON_ALPHA_RE = re.compile(r"[^a-zа-яё]")
+_NON_DIGIT_RE = re.compile(r"\D")
+_NON_ALNUM_RE = re.compile(r"[^a-zа-яё0-9]")
+_REPEATED_CHAR_RE = re.compile(r"(.)\1{4,}")
+_REPEATED_SYLLABLE_RE = re.compile(r"([a-zа-яё]{1,4})\1{4,}")
+_REPEATED_DIGITS_RE = re.compile(r"(\d{1,6})\1{3,}")
+
+_LINK_RE = re.compile(r"https?://\S+|www\.\S+")
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001f1e6-\U0001f1ff"  # flags
+    "\U0001f300-\U0001f5ff"  # symbols & pictographs
+    "\U0001f600-\U0001f64f"  # emoticons
+    "\U0001f680-\U0001f6ff"  # transport & map
+    "\U0001f700-\U0001f77f"
+    "\U0001f780-\U0001f7ff"
+    "\U0001f800-\U0001f8ff"
+    "\U0001f900-\U0001f9ff"  # supplemental symbols
+    "\U0001fa00-\U0001faff"
+    "\U00002700-\U000027bf"
+    "\U00002600-\U000026ff"
+    "\U000024c2-\U0001f251"
+    "\u200d\ufe0f"  # zero-width joiner and variation selector glue
+    "]+",
+    flags=re.UNICODE,
+)
+_DISALLOWED_CHARS_RE = re.compile(r"[^\w\s\.\,\!\?\-\:\'\"\(\)]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def clean_symbol_spam(text: str):
     """Drop tokens that look like repetitive gibberish spam."""
     token = str(text or "").strip()
@@ -193,9 +232,9 @@ def clean_symbol_spam(text: str):
     # spam_replacement = "".join(dict.fromkeys(token)) + "..."
 
     lowered = token.lower()
-    alpha = re.sub(r"[^a-zа-яё]", "", lowered)
-    digits = re.sub(r"\D", "", lowered)
-    alnum = re.sub(r"[^a-zа-яё0-9]", "", lowered)
+    alpha = _NON_ALPHA_RE.sub("", lowered)
+    digits = _NON_DIGIT_RE.sub("", lowered)
+    alnum = _NON_ALNUM_RE.sub("", lowered)
 
     def _has_strong_periodic_pattern(s: str, min_len: int) -> bool:
         if len(s) < min_len:
@@ -216,9 +255,9 @@ def clean_symbol_spam(text: str):
         return False
 
     if alpha:
-        if re.search(r"(.)\1{4,}", alpha):
+        if _REPEATED_CHAR_RE.search(alpha):
             return f"{token[:3]}..."
-        if re.search(r"([a-zа-яё]{1,4})\1{4,}", alpha):
+        if _REPEATED_SYLLABLE_RE.search(alpha):
             return ""
         if _has_strong_periodic_pattern(alpha, min_len=10):
             return ""
@@ -227,7 +266,7 @@ def clean_symbol_spam(text: str):
             return ""
 
     if digits:
-        if re.search(r"(\d{1,6})\1{3,}", digits):
+        if _REPEATED_DIGITS_RE.search(digits):
             return ""
         if _has_strong_periodic_pattern(digits, min_len=10):
             return ""
@@ -238,38 +277,52 @@ def clean_symbol_spam(text: str):
     return text
 
 
+@lru_cache(maxsize=4096)
+def number_to_words(number: int, lang: str):
+    """Spell out a number, cached since chat repeats the same small numbers."""
+    return num2words(number, lang=lang)
+
+
+def _trie_pattern(node):
+    """Build a regex from a prefix trie so shared prefixes are matched once."""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    pattern = f"(?:{"|".join(branches)})"
+    return f"{pattern}?" if "" in node else pattern
+
+
+def compile_stop_words(words):
+    """Compile stop words into one case-insensitive pattern bounded like words."""
+    if not words:
+        return None
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        node[""] = None
+    # Same boundary as the single-word lookup, so "phrase!" still matches
+    return re.compile(rf"(?<!\w){_trie_pattern(trie)}(?!\w)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=2048)
 def clean_message(text, ui_lang):
     """Clean message from garbage"""
 
     text = str(text or "")
 
-    text = re.sub(r"https?://\S+", f":{_(ui_lang, "Link")}:", text)
-    text = re.sub(r"www\.\S+", f":{_(ui_lang, "Link")}:", text)
-
-    emoji_pattern = re.compile(
-        "["
-        "\U0001f1e6-\U0001f1ff"  # flags
-        "\U0001f300-\U0001f5ff"  # symbols & pictographs
-        "\U0001f600-\U0001f64f"  # emoticons
-        "\U0001f680-\U0001f6ff"  # transport & map
-        "\U0001f700-\U0001f77f"
-        "\U0001f780-\U0001f7ff"
-        "\U0001f800-\U0001f8ff"
-        "\U0001f900-\U0001f9ff"  # supplemental symbols
-        "\U0001fa00-\U0001faff"
-        "\U00002700-\U000027bf"
-        "\U00002600-\U000026ff"
-        "\U000024c2-\U0001f251"
-        "]+",
-        flags=re.UNICODE,
-    )
-    text = emoji_pattern.sub("", text)
-    # Remove emoji glue/modifiers that can remain after stripping main codepoints.
-    text = re.sub(r"[\u200d\ufe0f\U0001f3fb-\U0001f3ff]", "", text)
-
-    text = re.sub(r"[^\w\s\.\,\!\?\-\:\'\"\(\)]", " ", text)
-
-    text = re.sub(r"\s+", " ", text)
+    text = _LINK_RE.sub(f":{_(ui_lang, "Link")}:", text)
+    if not text.isascii():
+        text = _EMOJI_RE.sub("", text)
+    text = _DISALLOWED_CHARS_RE.sub(" ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     text = text.strip()
 
     text_arr = []
@@ -284,23 +337,9 @@ def transliteration(text: str, lang: str):
     pass
 
 
-@lru_cache
-def avatar_colors_from_name(name: str):
-    """Deterministic avatar background and foreground color from author name."""
-    if not name:
-        return "#777777", "#ffffff"
-
-    # Use MD5 hash to get stable value from name
-    digest = hashlib.md5(name.encode("utf-8")).digest()
-    # Take 3 bytes to form a value for hue
-    val = int.from_bytes(digest[:3], "big")
-    hue = val % 360
-
+def _avatar_color(hue: int):
     # HLS -> colorsys uses H,L,S where H in [0,1]
-    h = hue / 360.0
-    l = 0.50
-    s = 0.65
-    r, g, b = colorsys.hls_to_rgb(h, l, s)
+    r, g, b = colorsys.hls_to_rgb(hue / 360.0, 0.50, 0.65)
     r_i, g_i, b_i = int(r * 255), int(g * 255), int(b * 255)
     bg = f"#{r_i:02x}{g_i:02x}{b_i:02x}"
 
@@ -308,3 +347,24 @@ def avatar_colors_from_name(name: str):
     lum = 0.299 * r + 0.587 * g + 0.114 * b
     fg = "#000000" if lum > 0.6 else "#ffffff"
     return bg, fg
+
+
+_AVATAR_PALETTE = tuple(_avatar_color(hue) for hue in range(360))
+
+
+@lru_cache(maxsize=4096)
+def avatar_colors_from_name(name: str):
+    """Deterministic avatar background and foreground color from author name."""
+    if not name:
+        return "#777777", "#ffffff"
+
+    # CRC32 is stable across runs, unlike the salted builtin hash
+    return _AVATAR_PALETTE[zlib.crc32(name.encode("utf-8")) % 360]
+
+
+@lru_cache(maxsize=4096)
+def author_avatar(author: str):
+    """Avatar letter and avatar background of an author for the chat log."""
+    avatar_text = author[:1].upper() if author else "?"
+    avatar_bg, _avatar_fg = avatar_colors_from_name(author)
+    return avatar_text, avatar_bg
@@ -140,7 +140,10 @@ class YouTubeChatListener:
                 self.on_error(_(self.lang, "not_determine_video_id"))
                 return False
 
-            self.client = build("youtube", "v3", developerKey=self._api_key_)
+            # The bundled discovery document is used; no on-disk cache lookup
+            self.client = build(
+                "youtube", "v3", developerKey=self._api_key_, cache_discovery=False
+            )
             self.chat_id = self._get_chat_id()
             if not self.chat_id:
                 return False
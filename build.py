@@ -39,10 +39,8 @@ HIDDEN_IMPORTS = [
     "sys",
     "threading",
     "inspect",
-    "multiprocessing",
     "time",
     "typing",
-    "hashlib",
     "num2words",
     "torch",
     "sounddevice",
@@ -1,21 +1,24 @@
 import os
 from random import randint
 import sys
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
 from queue import Empty, Full, Queue
-from datetime import datetime
 import gc
 import json
-import html
 import re
 import threading
-from time import sleep
-import hashlib
+from time import sleep, strftime
 
 from detoxify import Detoxify
-from num2words import num2words
-import sounddevice as sd
-from torch import hub, no_grad, set_grad_enabled, set_num_threads
+from torch import (
+    hub,
+    inference_mode,
+    set_grad_enabled,
+    set_num_interop_threads,
+    set_num_threads,
+)
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -38,12 +41,23 @@ from PyQt6.QtWidgets import (
     QPlainTextEdit,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QTimer, QFile, QIODevice
-from PyQt6.QtGui import QFont, QAction, QPalette, QTextCursor, QIcon
+from PyQt6.QtCore import Qt, QTimer, QFile, QIODevice, QMetaObject, pyqtSlot
+from PyQt6.QtGui import (
+    QFont,
+    QAction,
+    QColor,
+    QPalette,
+    QTextCharFormat,
+    QTextCursor,
+    QTextFormat,
+    QTextLength,
+    QTextTableCellFormat,
+    QTextTableFormat,
+    QIcon,
+)
 from PyQt6.QtGui import QShortcut, QKeySequence
-from scipy.signal import resample
+from scipy.signal import resample_poly
 import numpy as np
-from googletrans import Translator
 
 from app.schema import MessageStatsTD, TwitchCredentialsTD
 from app.translations import (
@@ -51,28 +65,42 @@ from app.translations import (
     TRANSLATIONS,
     _,
     translate_text,
+    translate_texts,
     transliteration,
 )
+from app.audio_player import AudioPlayer
+from app.model_loader import ModelLoader
 from app.twitch.auth_worker import AuthWorker
 from app.twitch.chat_listener import TwitchChatListener
 from app.constants import (
     APP_VERSION,
     APP_NAME,
     PADDING,
+    SAMPLE_RATE,
+    TTS_CACHE_BYTES,
+    TTS_CACHE_MAX_TEXT,
     DEFAULT_BUFFER_SIZE,
+    DETOX_BATCH_SIZE,
+    MAX_LOG_MESSAGES,
+    MAX_PROCESSED_MESSAGES,
+    MSG_BUFFER_SIZE,
     VOICES,
     MODELS,
+    TRANSLATION_GROWTH,
 )
 from app.utils import (
-    avatar_colors_from_name,
+    atomic_write,
+    author_avatar,
     clean_message,
     clear_detoxify_checkpoint_cache,
+    compile_stop_words,
     configure_torch_hub_cache,
     ensure_stdio_streams,
     find_cached_detoxify_checkpoint,
     find_cached_silero_repo,
     get_settings_path,
     icon_path,
+    number_to_words,
     prefer_cached_silero_package,
     resource_path,
 )
@@ -88,9 +116,13 @@ window_flag_fixed = (
 twitch_default_credentials = TwitchCredentialsTD(
     client_id=None, access=None, refresh=None, nickname=None
 )
+_NUMBER_RE = re.compile(r"-?\d+(?:[.,]\d+)?")
+_WORD_RE = re.compile(r"\w+")
 
 
 class MainWindow(QMainWindow):
+    # Loaded Silero models by (voice language, speaker model)
+
     def __init__(self):
         super().__init__()
         icon = QIcon(resource_path(icon_path()))
@@ -109,6 +141,8 @@ class MainWindow(QMainWindow):
         self.speech_rate = 1.00
         self.speech_delay = 1.5
         self.is_paused = False
+        self.playback_allowed = threading.Event()
+        self.playback_allowed.set()
         self.min_msg_length = 2
         self.max_msg_length = 200
         self.toxic_sense = 0.6
@@ -121,6 +155,8 @@ class MainWindow(QMainWindow):
         self.subscribers_only = False
         self.auto_translate = False
         self.stop_words = tuple()
+        self._stop_words_set = frozenset()
+        self._stop_words_re = None
         self.chat_only_mode = False
 
         # Connections
@@ -133,41 +169,74 @@ class MainWindow(QMainWindow):
         self.twitch_is_connected = False
 
         self.messages_stats: MessageStatsTD = defaultdict(int)
+        self.stats_lock = threading.Lock()
 
         # Message queue
         self.buffer_maxsize = DEFAULT_BUFFER_SIZE
-        self._pending_messages = deque()
+        # Anything older than the last MAX_LOG_MESSAGES would be trimmed on insert
+        self._pending_messages = deque(maxlen=MAX_LOG_MESSAGES)
+        self._hidden_messages = deque(maxlen=MAX_LOG_MESSAGES)
         self._pending_ui_updates = deque()
+        self._flush_scheduled = False
         self.toxic_dict = defaultdict(int)
         self.banned_set = set()
-        self.processed_messages = set()
+        self.processed_messages = OrderedDict()
 
         self.load_settings()
-
+        self.update_stats_template()
+        self.update_speech_phrases()
+
+        # Settings and stop words are written off the GUI thread
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        # Worker errors are machine-translated here so workers never wait on it
+        self._error_executor = ThreadPoolExecutor(max_workers=1)
+
+        # Timer to coalesce settings writes
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.save_settings)
+
+        self.msg_buffer = Queue(maxsize=MSG_BUFFER_SIZE)
+        self.tts_queue = Queue(maxsize=self.buffer_maxsize)
+        # Raw Silero output by (voice language, voice, accents, text)
+        self._tts_cache = OrderedDict()
+        self._tts_cache_bytes = 0
+        self.audio_player = AudioPlayer(samplerate=SAMPLE_RATE)
         self.audio_queue = Queue(maxsize=self.buffer_maxsize)
+        # Bumped by "Clear queue" so a clip held through a pause is dropped
+        self._clear_generation = 0
+        self._audio_on_hold = False
 
         self.setup_ui()
 
         self.detox_model = None
         self.model = None
         self.model_lock = threading.Lock()
-        self.translator = Translator()
-        self.translator_lock = threading.Lock()
+        # Loaded Silero models by (voice language, speaker model)
+        self._silero_models = {}
 
         configure_torch_hub_cache()
-        set_num_threads(2)
+        # Leave one core for the GUI; Silero gains little past four threads
+        set_num_threads(max(1, min(4, (os.cpu_count() or 2) - 1)))
+        set_num_interop_threads(1)
         set_grad_enabled(False)
 
-        threading.Thread(target=self.init_silero, daemon=True).start()
+        # Models loaded at startup; the heap is frozen once all have finished
+        self._startup_loads = {"silero"}
+        self.init_silero()
         if self.toxic_sense < 1.0:
-            threading.Thread(target=self.init_detoxify, daemon=True).start()
+            self._startup_loads.add("detoxify")
+            self.init_detoxify()
+        threading.Thread(target=self.process_tts_loop, daemon=True).start()
         threading.Thread(target=self.process_audio_loop, daemon=True).start()
-        # threading.Thread(target=self.process_msg_buffer_loop, daemon=True).start()
+        threading.Thread(target=self.process_msg_buffer_loop, daemon=True).start()
 
     # === UI setup ===
 
     def setup_voice_menu(self):
         self.voice_menu.clear()
+        self._voice_actions = {}
         for voice_lang in VOICES.keys():
             voice_lang_menu = self.voice_menu.addMenu(voice_lang)
 
@@ -182,8 +251,10 @@ class MainWindow(QMainWindow):
                     lambda checked, l=voice_lang, v=voice: self.voice_changed(l, v)
                 )
                 voice_lang_menu.addAction(voice_action)
+                self._voice_actions[(voice_lang, voice)] = voice_action
 
         add_accents_action = QAction(_(self.language, "Add accents"), self)
+        self._menu_texts.append((add_accents_action.setText, "Add accents"))
         add_accents_action.setCheckable(True)
         add_accents_action.setChecked(self.add_accents)
         add_accents_action.triggered.connect(self.toggle_add_accents)
@@ -191,6 +262,7 @@ class MainWindow(QMainWindow):
 
     def setup_language_menu(self):
         self.language_menu.clear()
+        self._language_actions = {}
         for lang in TRANSLATIONS.keys():
             lang_action = QAction(lang, self)
             lang_action.setCheckable(True)
@@ -199,14 +271,31 @@ class MainWindow(QMainWindow):
                 lambda checked, l=lang: self.language_changed(l)
             )
             self.language_menu.addAction(lang_action)
+            self._language_actions[lang] = lang_action
+
+    def update_voice_menu(self):
+        for (voice_lang, voice), voice_action in self._voice_actions.items():
+            voice_action.setChecked(
+                voice == self.voice and voice_lang == self.voice_language
+            )
+
+    def retranslate_menu_bar(self):
+        for set_text, key in self._menu_texts:
+            set_text(_(self.language, key))
+        for lang, lang_action in self._language_actions.items():
+            lang_action.setChecked(lang == self.language)
 
     def setup_menu_bar(self):
         menu_bar = QMenuBar(self)
         self.setMenuBar(menu_bar)
+        # Menu and action texts to refresh on language change
+        self._menu_texts = []
 
         file_menu = menu_bar.addMenu(_(self.language, "File"))
+        self._menu_texts.append((file_menu.setTitle, "File"))
 
         export_log_action = QMenu(_(self.language, "Export log"), file_menu)
+        self._menu_texts.append((export_log_action.setTitle, "Export log"))
         file_menu.addMenu(export_log_action)
         msg_log_html_action = QAction("Html", export_log_action)
         msg_log_html_action.triggered.connect(lambda: self.export_log("html"))
@@ -219,30 +308,37 @@ class MainWindow(QMainWindow):
         export_log_action.addAction(msg_log_text_action)
 
         self.language_menu = menu_bar.addMenu(_(self.language, "Language"))
+        self._menu_texts.append((self.language_menu.setTitle, "Language"))
         self.setup_language_menu()
 
         self.voice_menu = menu_bar.addMenu(_(self.language, "Speech configuration"))
+        self._menu_texts.append((self.voice_menu.setTitle, "Speech configuration"))
         self.setup_voice_menu()
 
         msg_settings_menu = menu_bar.addMenu(_(self.language, "Message Settings"))
+        self._menu_texts.append((msg_settings_menu.setTitle, "Message Settings"))
 
         banned_action = QAction(_(self.language, "List of banned"), msg_settings_menu)
+        self._menu_texts.append((banned_action.setText, "List of banned"))
         banned_action.triggered.connect(self.on_list_of_banned_action)
         msg_settings_menu.addAction(banned_action)
 
         stop_words_action = QAction(_(self.language, "Stop words"), msg_settings_menu)
+        self._menu_texts.append((stop_words_action.setText, "Stop words"))
         stop_words_action.triggered.connect(self.on_stop_words_action)
         msg_settings_menu.addAction(stop_words_action)
 
         delays_action = QAction(
             _(self.language, "Delays and processing"), msg_settings_menu
         )
+        self._menu_texts.append((delays_action.setText, "Delays and processing"))
         delays_action.triggered.connect(self.on_delays_settings_action)
         msg_settings_menu.addAction(delays_action)
 
         read_authors_action = QAction(
             _(self.language, "Read author names"), msg_settings_menu
         )
+        self._menu_texts.append((read_authors_action.setText, "Read author names"))
         read_authors_action.setCheckable(True)
         read_authors_action.setChecked(self.read_author_names)
         read_authors_action.triggered.connect(self.toggle_read_author_names)
@@ -251,6 +347,7 @@ class MainWindow(QMainWindow):
         read_platform_action = QAction(
             _(self.language, "Read platform name"), msg_settings_menu
         )
+        self._menu_texts.append((read_platform_action.setText, "Read platform name"))
         read_platform_action.setCheckable(True)
         read_platform_action.setChecked(self.read_platform_names)
         read_platform_action.triggered.connect(self.toggle_read_platform_names)
@@ -259,6 +356,7 @@ class MainWindow(QMainWindow):
         subscribers_only_action = QAction(
             _(self.language, "Subscribers only"), msg_settings_menu
         )
+        self._menu_texts.append((subscribers_only_action.setText, "Subscribers only"))
         subscribers_only_action.setCheckable(True)
         subscribers_only_action.setChecked(self.subscribers_only)
         subscribers_only_action.triggered.connect(self.toggle_subscribers_only)
@@ -267,6 +365,7 @@ class MainWindow(QMainWindow):
         auto_translate_action = QAction(
             _(self.language, "Translate messages"), msg_settings_menu
         )
+        self._menu_texts.append((auto_translate_action.setText, "Translate messages"))
         auto_translate_action.setCheckable(True)
         auto_translate_action.setChecked(self.auto_translate)
         auto_translate_action.triggered.connect(self.toggle_auto_translate)
@@ -322,12 +421,10 @@ class MainWindow(QMainWindow):
         connections_grid.addLayout(twitch_layout, 0, 1)
 
     def setup_pause_button_color(self):
-        palette = self.pause_button.palette()
         if self.is_paused:
-            palette.setColor(QPalette.ColorRole.Button, Qt.GlobalColor.darkRed)
-            self.pause_button.setPalette(palette)
+            self.pause_button.setPalette(self._palette_paused)
         else:
-            self.pause_button.setPalette(self.style().standardPalette())
+            self.pause_button.setPalette(self._palette_default)
 
     def setup_central_widget(self):
         chat_header_layout = QHBoxLayout()
@@ -376,12 +473,30 @@ class MainWindow(QMainWindow):
         self.chat_text = QTextEdit()
         self.chat_text.setReadOnly(True)
         self.chat_text.setAcceptRichText(True)
+        # The log is only appended to and trimmed; an undo history of every
+        # inserted row would grow without bound
+        self.chat_text.setUndoRedoEnabled(False)
         self.root_layout.addWidget(self.chat_text)
 
-        # Timer to flush messages added from background threads
-        self._flush_timer = QTimer(self)
-        self._flush_timer.timeout.connect(self._flush_pending_messages)
-        self._flush_timer.start(100)
+        # Every chat row is a 1x2 table: avatar letter | author, meta and text
+        self._msg_table_format = QTextTableFormat()
+        self._msg_table_format.setBorder(0)
+        self._msg_table_format.setBorderCollapse(False)
+        self._msg_table_format.setCellPadding(5)
+        self._msg_table_format.setCellSpacing(10)
+        self._msg_table_format.setWidth(
+            QTextLength(QTextLength.Type.PercentageLength, 100)
+        )
+        self._msg_table_format.setColumnWidthConstraints(
+            [
+                QTextLength(QTextLength.Type.FixedLength, 48),
+                QTextLength(QTextLength.Type.VariableLength, 0),
+            ]
+        )
+        # Row formats by (color, background), avatar cells by avatar color
+        self._row_formats = {}
+        self._avatar_cell_formats = {}
+        self._log_rows = 0
 
     def setup_status_bar(self):
         self.version_label = QLabel(f"v{APP_VERSION}")
@@ -393,6 +508,11 @@ class MainWindow(QMainWindow):
         self.stats_label.setContentsMargins(PADDING, 0, PADDING, 10)
         self.statusBar().addWidget(self.stats_label, 1)
 
+        # Timer to refresh stats independently of the message rate
+        self._stats_timer = QTimer(self)
+        self._stats_timer.timeout.connect(self.on_change_stats)
+        self._stats_timer.start(500)
+
         self.voice_label = QLabel(self.status_voice_text())
         self.voice_label.setContentsMargins(PADDING, 0, 0, 5)
         self.statusBar().addWidget(self.voice_label)
@@ -431,7 +551,22 @@ class MainWindow(QMainWindow):
         self.speech_rate_label_value.setContentsMargins(0, 0, 0, 5)
         self.statusBar().addWidget(self.speech_rate_label_value)
 
+    def setup_palettes(self):
+        self._palette_default = self.style().standardPalette()
+
+        self._palette_connected = QPalette(self._palette_default)
+        self._palette_connected.setColor(
+            QPalette.ColorRole.Button, Qt.GlobalColor.darkGreen
+        )
+        self._palette_connected.setColor(
+            QPalette.ColorRole.ButtonText, Qt.GlobalColor.white
+        )
+
+        self._palette_paused = QPalette(self._palette_default)
+        self._palette_paused.setColor(QPalette.ColorRole.Button, Qt.GlobalColor.darkRed)
+
     def setup_ui(self):
+        self.setup_palettes()
         self.setup_menu_bar()
         self.setup_status_bar()
         self.setup_connections_grid()
@@ -498,20 +633,23 @@ class MainWindow(QMainWindow):
         )
         self.setup_pause_button_color()
         if self.is_paused:
-            sd.stop()
+            self.playback_allowed.clear()
+            self.audio_player.stop()
             self.statusBar().showMessage(
                 _(self.language, "Playback has been stopped"), 3000
             )
         else:
+            self.playback_allowed.set()
             self.statusBar().showMessage(
                 _(self.language, "Speech playback continued..."), 3000
             )
 
     def language_changed(self, lang):
         self.language = lang
-        self.save_settings()
-        self.setup_menu_bar()
+        self.schedule_save()
+        self.retranslate_menu_bar()
         self.apply_chat_only_mode()
+        self.update_stats_template()
         self.on_change_stats()
         self.speech_rate_label.setText(_(self.language, "Speech rate"))
         self.vol_label.setText(_(self.language, "Volume"))
@@ -540,11 +678,12 @@ class MainWindow(QMainWindow):
         self.voice = voice
         if self.voice_language != lang:
             self.voice_language = lang
-            threading.Thread(target=self.init_silero, daemon=True).start()
-            self.stop_words = self.load_stop_words(self.voice_language)
+            self.update_speech_phrases()
+            self.init_silero()
+            self.set_stop_words(self.load_stop_words(self.voice_language))
 
-        self.save_settings()
-        self.setup_voice_menu()
+        self.schedule_save()
+        self.update_voice_menu()
         self.voice_label.setText(self.status_voice_text())
 
     def speech_rate_changed(self, value):
@@ -670,7 +809,7 @@ class MainWindow(QMainWindow):
             self.twitch_credentials["refresh"] = refresh_token
             self.twitch_credentials["client_id"] = client_id
             self.twitch_credentials["nickname"] = nickname
-            self.save_settings()
+            self.schedule_save()
             self.add_sys_message(
                 author="Twitch",
                 text=_(self.language, "Success authorized"),
@@ -785,7 +924,7 @@ class MainWindow(QMainWindow):
         self.twitch_input.setReadOnly(False)
 
         self.connect_twitch_button.setText(_(self.language, "Connect"))
-        self.connect_twitch_button.setPalette(self.style().standardPalette())
+        self.connect_twitch_button.setPalette(self._palette_default)
         self.add_sys_message(
             author="Twitch",
             text=_(self.language, "chat_disconnected"),
@@ -797,10 +936,7 @@ class MainWindow(QMainWindow):
         self.twitch_input.setReadOnly(True)
 
         self.connect_twitch_button.setText(_(self.language, "Connected"))
-        palette = self.connect_twitch_button.palette()
-        palette.setColor(QPalette.ColorRole.Button, Qt.GlobalColor.darkGreen)
-        palette.setColor(QPalette.ColorRole.ButtonText, Qt.GlobalColor.white)
-        self.connect_twitch_button.setPalette(palette)
+        self.connect_twitch_button.setPalette(self._palette_connected)
         self.add_sys_message(
             author="Twitch", text=_(self.language, "chat_connected"), status="success"
         )
@@ -920,10 +1056,7 @@ class MainWindow(QMainWindow):
             author="YouTube", text=_(self.language, "chat_connected"), status="success"
         )
         self.connect_yt_button.setText(_(self.language, "Connected"))
-        palette = self.connect_yt_button.palette()
-        palette.setColor(QPalette.ColorRole.Button, Qt.GlobalColor.darkGreen)
-        palette.setColor(QPalette.ColorRole.ButtonText, Qt.GlobalColor.white)
-        self.connect_yt_button.setPalette(palette)
+        self.connect_yt_button.setPalette(self._palette_connected)
 
     def on_disconnect_yt(self):
         self.yt_is_connected = False
@@ -935,7 +1068,7 @@ class MainWindow(QMainWindow):
             status="success",
         )
         self.connect_yt_button.setText(_(self.language, "Connect"))
-        self.connect_yt_button.setPalette(self.style().standardPalette())
+        self.connect_yt_button.setPalette(self._palette_default)
 
     def on_list_of_banned_action(self):
         dlg = QDialog(self)
@@ -994,16 +1127,15 @@ class MainWindow(QMainWindow):
 
     def on_save_stop_words(self):
         content = self.stop_words_text.toPlainText().strip()
-        self.stop_words = sorted(
-            tuple(set([w.strip() for w in content.splitlines() if w.strip()]))
+        self.set_stop_words(
+            tuple(sorted(set(filter(None, map(str.strip, content.splitlines())))))
         )
 
-        with open(
+        self._io_executor.submit(
+            atomic_write,
             resource_path(f"spam_filter/{self.voice_language}.txt"),
-            "w",
-            encoding="utf-8",
-        ) as f:
-            f.write("\n".join(self.stop_words) + "\n")
+            "\n".join(self.stop_words) + "\n",
+        )
 
         self.statusBar().showMessage(
             f"{_(self.language, "Saved")} {len(self.stop_words)} {_(self.language, "stop words")}",
@@ -1020,7 +1152,7 @@ class MainWindow(QMainWindow):
 
     def on_click_yt_save_settings(self):
         self.yt_credentials = self.google_api_key_input.text()
-        self.save_settings()
+        self.schedule_save()
         self.google_api_key_input.setText("*" * len(self.yt_credentials))
         self.google_api_key_input.setReadOnly(True)
         self.google_api_key_input.returnPressed.disconnect()
@@ -1045,6 +1177,8 @@ class MainWindow(QMainWindow):
         root_layout = QVBoxLayout(dlg)
         root_layout.setContentsMargins(PADDING, PADDING, PADDING, PADDING)
 
+        # Sliders preview the value while dragging and apply it on release
+
         # Toxicity threshold
 
         toxic_sense_v_layout = QVBoxLayout()
@@ -1064,6 +1198,10 @@ class MainWindow(QMainWindow):
         toxic_sense_slider.setMinimum(10)
         toxic_sense_slider.setMaximum(100)
         toxic_sense_slider.setValue(int(self.toxic_sense * 100))
+        toxic_sense_slider.setTracking(False)
+        toxic_sense_slider.sliderMoved.connect(
+            lambda v: self.toxic_sense_label_value.setText(f"{v / 100:.2f}")
+        )
         toxic_sense_slider.valueChanged.connect(self.on_change_toxic_sense)
 
         self.toxic_sense_label_value = QLabel(str(self.toxic_sense))
@@ -1088,6 +1226,10 @@ class MainWindow(QMainWindow):
         ban_limit_slider.setMinimum(1)
         ban_limit_slider.setMaximum(100)
         ban_limit_slider.setValue(self.ban_limit)
+        ban_limit_slider.setTracking(False)
+        ban_limit_slider.sliderMoved.connect(
+            lambda v: self.ban_limit_label_value.setText(str(v))
+        )
         ban_limit_slider.valueChanged.connect(self.on_change_ban_limit)
 
         self.ban_limit_label_value = QLabel(str(self.ban_limit))
@@ -1110,6 +1252,10 @@ class MainWindow(QMainWindow):
         queue_depth_slider.setMinimum(1)
         queue_depth_slider.setMaximum(100)
         queue_depth_slider.setValue(self.buffer_maxsize)
+        queue_depth_slider.setTracking(False)
+        queue_depth_slider.sliderMoved.connect(
+            lambda v: self.queue_depth_label_value.setText(str(v))
+        )
         queue_depth_slider.valueChanged.connect(self.on_change_queue_depth)
 
         self.queue_depth_label_value = QLabel(str(self.buffer_maxsize))
@@ -1132,6 +1278,10 @@ class MainWindow(QMainWindow):
         min_msg_len_slider.setMinimum(2)
         min_msg_len_slider.setMaximum(50)
         min_msg_len_slider.setValue(self.min_msg_length)
+        min_msg_len_slider.setTracking(False)
+        min_msg_len_slider.sliderMoved.connect(
+            lambda v: self.min_msg_len_label_value.setText(str(v))
+        )
         min_msg_len_slider.valueChanged.connect(self.on_change_min_msg_len)
 
         self.min_msg_len_label_value = QLabel(str(self.min_msg_length))
@@ -1154,6 +1304,10 @@ class MainWindow(QMainWindow):
         msg_len_slider.setMinimum(50)
         msg_len_slider.setMaximum(300)
         msg_len_slider.setValue(self.max_msg_length)
+        msg_len_slider.setTracking(False)
+        msg_len_slider.sliderMoved.connect(
+            lambda v: self.msg_len_label_value.setText(str(v))
+        )
         msg_len_slider.valueChanged.connect(self.on_change_max_msg_len)
 
         self.msg_len_label_value = QLabel(str(self.max_msg_length))
@@ -1178,6 +1332,10 @@ class MainWindow(QMainWindow):
         speech_delay_slider.setMinimum(5)
         speech_delay_slider.setMaximum(50)
         speech_delay_slider.setValue(int(self.speech_delay * 10))
+        speech_delay_slider.setTracking(False)
+        speech_delay_slider.sliderMoved.connect(
+            lambda v: self.speech_delay_label_value.setText(f"{v / 10:.2f}")
+        )
         speech_delay_slider.valueChanged.connect(self.on_change_queue_speech_delay)
 
         self.speech_delay_label_value = QLabel(str(self.speech_delay))
@@ -1185,7 +1343,7 @@ class MainWindow(QMainWindow):
 
         dlg.adjustSize()
         dlg.setFixedSize(dlg.sizeHint())
-        dlg.finished.connect(self.save_settings)
+        dlg.finished.connect(self.schedule_save)
         dlg.exec()
 
     def on_change_queue_speech_delay(self, value):
@@ -1203,23 +1361,39 @@ class MainWindow(QMainWindow):
     def on_change_queue_depth(self, value):
         self.buffer_maxsize = value
         self.queue_depth_label_value.setText(str(self.buffer_maxsize))
-        old_queue = self.audio_queue
-        self.audio_queue = Queue(maxsize=self.buffer_maxsize)
-        while True:
-            try:
-                self.audio_queue.put_nowait(old_queue.get_nowait())
-            except (Empty, Full):
-                break
+        # Resize in place so queued items and blocked producers are kept
+        for queue in (self.tts_queue, self.audio_queue):
+            with queue.mutex:
+                queue.maxsize = self.buffer_maxsize
+                while len(queue.queue) > self.buffer_maxsize:
+                    queue.queue.pop()
+                queue.not_full.notify_all()
+
+    def count_stat(self, key):
+        with self.stats_lock:
+            self.messages_stats[key] += 1
 
     def on_change_stats(self):
+        stats_key = (
+            self.messages_stats["messages_count"],
+            self.messages_stats["spoken_count"],
+            self.messages_stats["filtered_count"],
+            self.queued_count(),
+        )
+        # The timer ticks even when idle; only relayout the label on changes
+        if stats_key == self._last_stats_key:
+            return
+        self._last_stats_key = stats_key
         self.stats_label.setText(self.stats_text())
 
     def on_clear_queue(self):
-        while True:
-            try:
-                self.audio_queue.get_nowait()
-            except Empty:
-                break
+        for queue in (self.tts_queue, self.audio_queue):
+            while True:
+                try:
+                    queue.get_nowait()
+                except Empty:
+                    break
+        self._clear_generation += 1
         self.on_change_stats()
         self.statusBar().showMessage(_(self.language, "Queue cleared"), 3000)
 
@@ -1267,6 +1441,8 @@ class MainWindow(QMainWindow):
 
     def clear_log(self):
         self.chat_text.clear()
+        self._hidden_messages.clear()
+        self._log_rows = 0
         self.statusBar().showMessage(_(self.language, "Log cleared"), 3000)
 
     def export_log(self, choice):
@@ -1295,26 +1471,41 @@ class MainWindow(QMainWindow):
 
     # === Helper methods ===
 
-    def stats_text(self):
+    def update_speech_phrases(self):
+        """Translate the phrases spoken with every message once per voice language."""
+        self._said_phrase = _(self.voice_language, "said")
+        self._message_from_phrase = _(self.voice_language, "Message from")
+        self._point_phrase = _(self.voice_language, "point")
+        self._platform_phrases = {
+            platform: _(self.voice_language, platform.lower())
+            for platform in ("YouTube", "Twitch")
+        }
+
+    def update_stats_template(self):
+        self._last_stats_key = None
+        self._stats_template = (
+            f"{_(self.language, 'Messages')}: {{messages}} | "
+            f"{_(self.language, 'Spoken')}: {{spoken}} | "
+            f"{_(self.language, 'Filtered')}: {{filtered}} | "
+            f"{_(self.language, 'In queue')}: {{queue}}"
+        )
+
+    def queued_count(self):
         return (
-            f"{_(self.language, 'Messages')}: {self.messages_stats['messages_count']} | "
-            f"{_(self.language, 'Spoken')}: {self.messages_stats['spoken_count']} | "
-            f"{_(self.language, 'Filtered')}: {self.messages_stats['filtered_count']} | "
-            f"{_(self.language, 'In queue')}: {self.audio_queue.qsize()}"
+            self.tts_queue.qsize() + self.audio_queue.qsize() + int(self._audio_on_hold)
+        )
+
+    def stats_text(self):
+        return self._stats_template.format(
+            messages=self.messages_stats["messages_count"],
+            spoken=self.messages_stats["spoken_count"],
+            filtered=self.messages_stats["filtered_count"],
+            queue=self.queued_count(),
         )
 
     def status_voice_text(self):
         return f"{_(self.language, 'Voice')}: {_(self.language, self.voice_language)} - {self.voice}"
 
-    def colored_text(self, text, color=None, background=None):
-        style = ""
-        if color:
-            style += f"color: {color};"
-        if background:
-            style += f"background-color: {background};"
-        safe_text = html.escape(str(text)).replace("\n", "<br>")
-        return f'<span style="{style}">{safe_text}</span>'
-
     def add_sys_message(self, author, text, status="default"):
         status_colors = {
             "default": None,
@@ -1331,22 +1522,52 @@ class MainWindow(QMainWindow):
             background=status_colors[status],
         )
 
+    def add_sys_error(self, author, text, error, detail=""):
+        """Report a worker error without blocking the worker on its translation"""
+
+        def report():
+            self.add_sys_message(
+                author=author,
+                text=f"{text}. {translate_text(str(error), self.language)}{detail}",
+                status="error",
+            )
+
+        try:
+            self._error_executor.submit(report)
+        except RuntimeError:
+            # The window is closing
+            pass
+
     def add_message(self, platform, author, text, color=None, background=None):
-        self.messages_stats["messages_count"] += 1
-        self.on_change_stats()
+        self.count_stat("messages_count")
+        message = (platform, author, text, color, background, strftime("%H:%M:%S"))
 
-        # If called from a non-main thread, enqueue for the GUI flush timer
+        # If called from a non-main thread, enqueue for a GUI thread flush
         if threading.current_thread() is not threading.main_thread():
-            self._pending_messages.append((platform, author, text, color, background))
+            self._pending_messages.append(message)
+            self._schedule_flush()
             return
 
         # On main thread, insert immediately
-        self._insert_message(platform, author, text, color, background)
+        self._insert_message(*message)
 
+    def _schedule_flush(self):
+        """Queue one flush on the GUI thread for everything appended until it runs."""
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        QMetaObject.invokeMethod(
+            self, "_flush_pending_messages", Qt.ConnectionType.QueuedConnection
+        )
+
+    @pyqtSlot()
     def _flush_pending_messages(self):
-        while len(self._pending_messages) > 0:
-            platform, author, text, color, background = self._pending_messages.popleft()
-            self._insert_message(platform, author, text, color, background)
+        self._flush_scheduled = False
+        if self._pending_messages:
+            messages = []
+            while len(self._pending_messages) > 0:
+                messages.append(self._pending_messages.popleft())
+            self._insert_messages(messages)
         while len(self._pending_ui_updates) > 0:
             indicator_text = self._pending_ui_updates.popleft()
             self.audio_indicator.setText(indicator_text)
@@ -1356,72 +1577,138 @@ class MainWindow(QMainWindow):
             self.audio_indicator.setText(indicator_text)
             return
         self._pending_ui_updates.append(indicator_text)
+        self._schedule_flush()
+
+    def _message_formats(self, color, background):
+        """Text formats of a chat row, shared by all rows with the same colors."""
+        key = (color, background)
+        formats = self._row_formats.get(key)
+        if formats is None:
+            foreground = QColor(color or "#fff")
+
+            cell_format = QTextTableCellFormat()
+            cell_format.setBackground(QColor(background or "#444"))
+            cell_format.setVerticalAlignment(
+                QTextCharFormat.VerticalAlignment.AlignMiddle
+            )
+
+            avatar_format = QTextCharFormat()
+            avatar_format.setForeground(foreground)
+            avatar_format.setFontWeight(QFont.Weight.Bold)
+            avatar_format.setProperty(QTextFormat.Property.FontPixelSize, 40)
+
+            author_format = QTextCharFormat()
+            author_format.setForeground(foreground)
+            author_format.setFontWeight(QFont.Weight.Bold)
+
+            text_format = QTextCharFormat()
+            text_format.setForeground(foreground)
+
+            formats = (cell_format, avatar_format, author_format, text_format)
+            self._row_formats[key] = formats
+        return formats
+
+    def _avatar_cell_format(self, avatar_bg):
+        cell_format = self._avatar_cell_formats.get(avatar_bg)
+        if cell_format is None:
+            cell_format = QTextTableCellFormat()
+            cell_format.setBackground(QColor(avatar_bg))
+            cell_format.setVerticalAlignment(QTextCharFormat.VerticalAlignment.AlignTop)
+            self._avatar_cell_formats[avatar_bg] = cell_format
+        return cell_format
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._hidden_messages:
+            QTimer.singleShot(0, self._flush_hidden_messages)
+
+    def _flush_hidden_messages(self):
+        """Insert the messages that arrived while the chat log was hidden."""
+        if not self.chat_text.isVisible():
+            return
+        messages = list(self._hidden_messages)
+        self._hidden_messages.clear()
+        self._insert_messages(messages)
+
+    def _insert_message(
+        self, platform, author, text, color=None, background=None, timestamp=None
+    ):
+        self._insert_messages(((platform, author, text, color, background, timestamp),))
+
+    def _insert_messages(self, messages):
+        # Nothing to render while hidden; keep the tail of the log for later
+        if not self.chat_text.isVisible():
+            self._hidden_messages.extend(messages)
+            return
 
-    def _insert_message(self, platform, author, text, color=None, background=None):
-        time_str = datetime.now().strftime("%H:%M:%S")
-        safe_author = html.escape(str(author))
-        avatar_text = safe_author[:1].upper() if safe_author else "?"
-        avatar_bg, avatar_fg = avatar_colors_from_name(safe_author)
-        white_color = "#fff"
         scrollbar = self.chat_text.verticalScrollBar()
         prev_scroll_value = scrollbar.value()
 
-        message = f"""
-<table cellpadding="5" cellspacing="10" width="100%">
-    <tr>
-        <td width="48" valign="top">
-            <div
-            style="
-                width: 40px;
-                height: 40px;
-                max-height: 40px;
-                text-align: center;
-                vertical-align: middle;
-                font-weight: bold;
-                line-height: 40px;
-                border-radius: 20px;
-                background:{avatar_bg};
-                color:{avatar_fg};
-                overflow: hidden;
-            "
-            >
-                <span style="font-size: 40px; color: {color or white_color};">{avatar_text}</span>
-            </div>
-        </td>
-        <td valign="middle" bgcolor="{background or "#444"}">
-            <div>
-                <div>
-                    <b style="color: {color or white_color};">{safe_author}</b>
-                    <span style="font-weight: normal; color: {color or white_color};">[{time_str}] [{platform}]</span>
-                </div>
-                {self.colored_text(text, color=color or white_color)}
-            </div>
-        </td>
-    </tr>
-</table>
-        """
-
+        # Insert the whole batch without repaints and scroll once
+        self.chat_text.setUpdatesEnabled(False)
         try:
-            was_readonly = self.chat_text.isReadOnly()
-            if was_readonly:
-                self.chat_text.setReadOnly(False)
+            for message in messages:
+                self._append_message_row(*message)
+        finally:
+            self.chat_text.setUpdatesEnabled(True)
 
-            cursor = self.chat_text.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            cursor.insertHtml(message)
-            cursor.insertBlock()
-            self.chat_text.setTextCursor(cursor)
+        if self.auto_scroll:
+            scrollbar.setValue(scrollbar.maximum())
+        else:
+            scrollbar.setValue(prev_scroll_value)
 
-            if was_readonly:
-                self.chat_text.setReadOnly(True)
+    def _append_message_row(
+        self, platform, author, text, color=None, background=None, timestamp=None
+    ):
+        author = str(author)
+        avatar_text, avatar_bg = author_avatar(author)
+        cell_format, avatar_format, author_format, text_format = (
+            self._message_formats(color, background)
+        )
 
-            if self.auto_scroll:
-                scrollbar.setValue(scrollbar.maximum())
-            else:
-                scrollbar.setValue(prev_scroll_value)
+        try:
+            cursor = QTextCursor(self.chat_text.document())
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            table = cursor.insertTable(1, 2, self._msg_table_format)
+
+            avatar_cell = table.cellAt(0, 0)
+            avatar_cell.setFormat(self._avatar_cell_format(avatar_bg))
+            avatar_cell.firstCursorPosition().insertText(avatar_text, avatar_format)
+
+            msg_cell = table.cellAt(0, 1)
+            msg_cell.setFormat(cell_format)
+            cell_cursor = msg_cell.firstCursorPosition()
+            cell_cursor.insertText(author, author_format)
+            cell_cursor.insertText(
+                f" [{timestamp or strftime("%H:%M:%S")}] [{platform}]", text_format
+            )
+            cell_cursor.insertBlock()
+            cell_cursor.insertText(str(text), text_format)
+
+            self._log_rows += 1
+            if self._log_rows > MAX_LOG_MESSAGES:
+                self._trim_chat_log()
         except Exception:
             pass
 
+    def _trim_chat_log(self):
+        """Drop the oldest rows so the log document stays bounded."""
+        document = self.chat_text.document()
+        rows = document.rootFrame().childFrames()
+        # Trim a tenth of the limit at once so this runs rarely.
+        count = min(len(rows), self._log_rows - MAX_LOG_MESSAGES // 10 * 9)
+        if count <= 0:
+            return
+        cursor = QTextCursor(document)
+        cursor.setPosition(
+            rows[count - 1].lastPosition() + 1, QTextCursor.MoveMode.KeepAnchor
+        )
+        cursor.removeSelectedText()
+        self._log_rows = len(rows) - count
+
+    def schedule_save(self):
+        self._save_timer.start()
+
     def save_settings(self):
         settings = {
             "language": self.language,
@@ -1444,8 +1731,11 @@ class MainWindow(QMainWindow):
             "yt_credentials": self.yt_credentials,
             "twitch_credentials": self.twitch_credentials,
         }
-        with open(get_settings_path(), "w", encoding="utf-8") as f:
-            json.dump(settings, f, ensure_ascii=False, indent=2)
+        self._io_executor.submit(
+            atomic_write,
+            get_settings_path(),
+            json.dumps(settings, ensure_ascii=False, indent=2),
+        )
 
         self.statusBar().showMessage(_(self.language, "Settings saved"), 3000)
 
@@ -1497,7 +1787,7 @@ class MainWindow(QMainWindow):
             if not isinstance(self.twitch_credentials, dict):
                 self.twitch_credentials = twitch_default_credentials
 
-            self.stop_words = self.load_stop_words(self.voice_language)
+            self.set_stop_words(self.load_stop_words(self.voice_language))
             self.banned_set = self.load_banned_list()
 
         except FileNotFoundError:
@@ -1526,39 +1816,45 @@ class MainWindow(QMainWindow):
         source_path = resource_path(f"spam_filter/{lang}.txt")
         try:
             with open(source_path, "r", encoding="utf-8") as file:
-                return tuple(line.strip() for line in file if line.strip())
+                return tuple(filter(None, map(str.strip, file.read().splitlines())))
         except FileNotFoundError:
             pass
         except Exception as e:
             pass
         return tuple()
 
+    def set_stop_words(self, words):
+        self.stop_words = words
+        # Single words are looked up in a set, phrases go through the regex
+        lowered = {w.lower() for w in words}
+        self._stop_words_set = frozenset(w for w in lowered if _WORD_RE.fullmatch(w))
+        self._stop_words_re = compile_stop_words(lowered - self._stop_words_set)
+
     def closeEvent(self, event):
+        self._save_timer.stop()
         self.save_settings()
-        sd.stop()
+        self._io_executor.shutdown(wait=True)
+        self._error_executor.shutdown(wait=False, cancel_futures=True)
+        self.audio_player.close()
         super().closeEvent(event)
 
     def init_detoxify(self):
-        cached_checkpoint = None
+        self.add_sys_message(author="Detoxify", text=_(self.language, "detoxify_loading"))
+        loader = ModelLoader(self.load_detoxify, lang=self.language, parent=self)
+        loader.loaded_signal.connect(self.on_detoxify_loaded)
+        loader.error_signal.connect(self.on_detoxify_failed)
+        loader.start()
+
+    def load_detoxify(self):
+        ensure_stdio_streams()
+        cached_checkpoint = find_cached_detoxify_checkpoint("multilingual")
         try:
-            ensure_stdio_streams()
-            self.add_sys_message(
-                author="Detoxify", text=_(self.language, "detoxify_loading")
-            )
-            cached_checkpoint = find_cached_detoxify_checkpoint("multilingual")
             if cached_checkpoint:
-                self.detox_model = Detoxify(
+                return Detoxify(
                     model_type="multilingual",
                     checkpoint=cached_checkpoint,
                 )
-            else:
-                self.detox_model = Detoxify("multilingual")
-            self.add_sys_message(
-                author="Detoxify",
-                text=_(self.language, "detoxify_loaded"),
-                status="success",
-            )
-
+            return Detoxify("multilingual")
         except Exception as e:
             error_text = str(e)
             if (
@@ -1567,75 +1863,102 @@ class MainWindow(QMainWindow):
             ):
                 if cached_checkpoint and os.path.isfile(cached_checkpoint):
                     try:
-                        self.add_sys_message(
-                            author="Detoxify",
-                            text=f"{_(self.language, "detoxify_loading_failed")}. {_(self.language, "The file is corrupted")}",
-                            status="error",
-                        )
                         os.remove(cached_checkpoint)
-                        return
+                        raise RuntimeError(
+                            _(self.language, "The file is corrupted")
+                        ) from e
                     except OSError:
                         pass
                 clear_detoxify_checkpoint_cache("multilingual")
-            self.add_sys_message(
-                author="Detoxify",
-                text=f"{_(self.language, "detoxify_loading_failed")}. {translate_text(str(e), self.language)}",
-                status="error",
-            )
+            raise
+
+    def finish_startup_load(self, name):
+        if name not in self._startup_loads:
+            return
+        self._startup_loads.discard(name)
+        if not self._startup_loads:
+            # Keep torch, the models and the UI out of later GC scans
+            gc.collect()
+            gc.freeze()
+
+    def on_detoxify_loaded(self, model):
+        self.detox_model = model
+        self.finish_startup_load("detoxify")
+        self.add_sys_message(
+            author="Detoxify",
+            text=_(self.language, "detoxify_loaded"),
+            status="success",
+        )
+
+    def on_detoxify_failed(self, error_text):
+        self.finish_startup_load("detoxify")
+        self.add_sys_message(
+            author="Detoxify",
+            text=f"{_(self.language, "detoxify_loading_failed")}. {error_text}",
+            status="error",
+        )
 
     def init_silero(self):
         self.add_sys_message(author="Silero", text=_(self.language, "silero_loading"))
+        loader = ModelLoader(self.load_silero, lang=self.language, parent=self)
+        loader.loaded_signal.connect(self.on_silero_loaded)
+        loader.error_signal.connect(self.on_silero_failed)
+        loader.start()
+
+    def silero_key(self, lang):
+        return lang, MODELS[lang]
+
+    def load_silero(self):
+        # The voice language can change while this runs, so read it once
+        lang = self.voice_language
+        key = self.silero_key(lang)
+        model = self._silero_models.get(key)
+        if model is not None:
+            return key, model
+
         try:
             with self.model_lock:
+                model = self._silero_models.get(key)
+                if model is not None:
+                    return key, model
                 if getattr(sys, "frozen", False):
                     cached_repo = find_cached_silero_repo()
                     if cached_repo:
                         prefer_cached_silero_package(cached_repo)
-                        self.model, txt = hub.load(
+                        model, txt = hub.load(
                             repo_or_dir=cached_repo,
                             source="local",
                             model="silero_tts",
-                            language=self.voice_language,
-                            speaker=MODELS[self.voice_language],
+                            language=lang,
+                            speaker=key[1],
                             trust_repo=True,
                             force_reload=False,
                             verbose=False,
                         )
                     else:
-                        self.model, txt = hub.load(
+                        model, txt = hub.load(
                             repo_or_dir="snakers4/silero-models",
                             source="github",
                             model="silero_tts",
-                            language=self.voice_language,
-                            speaker=MODELS[self.voice_language],
+                            language=lang,
+                            speaker=key[1],
                             trust_repo=True,
                             force_reload=False,
                             verbose=False,
                         )
                 else:
-                    self.model, txt = hub.load(
+                    model, txt = hub.load(
                         repo_or_dir="snakers4/silero-models",
                         model="silero_tts",
-                        language=self.voice_language,
-                        speaker=MODELS[self.voice_language],
+                        language=lang,
+                        speaker=key[1],
                         trust_repo=True,
                         force_reload=False,
                         verbose=False,
                     )
-
-            self.add_sys_message(
-                author="Silero",
-                text=_(self.language, "silero_loaded"),
-                status="success",
-            )
-
-        except Exception as e:
-            self.add_sys_message(
-                author="Silero",
-                text=f"{_(self.language, "silero_failed")}. {translate_text(str(e), self.language)}",
-                status="error",
-            )
-            return False
+                self.warm_up_silero(model, lang)
+                self._silero_models[key] = model
+            return key, model
         finally:
             try:
                 silero_catalog_path = os.path.join(
@@ -1645,30 +1968,75 @@ class MainWindow(QMainWindow):
             except OSError:
                 pass
 
+    def warm_up_silero(self, model, lang):
+        """Run one short synthesis so the first chat message is not the slow one"""
+        text = _(lang, "said")
+        try:
+            text = f"{text} {number_to_words(1, lang)}"
+        except Exception:
+            # Numbers fall back to digits in chat too; still warm up the model
+            pass
+        try:
+            with inference_mode():
+                model.apply_tts(
+                    text=text, speaker=VOICES[lang][0], sample_rate=SAMPLE_RATE
+                )
+        except Exception as e:
+            self.add_sys_error(
+                author="Silero",
+                text=_(self.language, "Error convert text to speech"),
+                error=e,
+                detail=f". TEXT: {text}",
+            )
+
+    def on_silero_loaded(self, result):
+        key, model = result
+        # A slower loader for a language the user already switched away from
+        if key != self.silero_key(self.voice_language):
+            return
+        self.model = model
+        self.finish_startup_load("silero")
+        self.add_sys_message(
+            author="Silero",
+            text=_(self.language, "silero_loaded"),
+            status="success",
+        )
+
+    def on_silero_failed(self, error_text):
+        self.finish_startup_load("silero")
+        self.add_sys_message(
+            author="Silero",
+            text=f"{_(self.language, "silero_failed")}. {error_text}",
+            status="error",
+        )
+
     def get_msg_hash(self, platform, author, message):
-        return hashlib.md5(f"{platform}:{author}:{message}".encode()).hexdigest()
+        return hash((platform, author, message))
 
     def contains_stop_words(self, text: str):
         """Check for stop words"""
-        text_words = text.split(" ")
-        for word in text_words:
-            if word in self.stop_words:
-                return True
-        return False
+        if not self._stop_words_set.isdisjoint(_WORD_RE.findall(text.lower())):
+            return True
+        if self._stop_words_re is None:
+            return False
+        return self._stop_words_re.search(text) is not None
 
     def convert_numbers_to_words(self, text):
         """Convert numbers to text representation"""
+        # Most chat messages have no digits at all
+        if _NUMBER_RE.search(text) is None:
+            return text
 
         def replace_number(match):
             num = match.group()
             try:
                 if "." in num:
                     parts = num.split(".")
-                    integer_part = num2words(int(parts[0]), lang=self.voice_language)
-                    fractional_part = num2words(int(parts[1]), lang=self.voice_language)
-                    return f"{integer_part} {_(self.voice_language, "point")} {fractional_part}"
+                    integer_part = number_to_words(int(parts[0]), self.voice_language)
+                    fractional_part = number_to_words(int(parts[1]), self.voice_language)
+                    return f"{integer_part} {self._point_phrase} {fractional_part}"
                 else:
-                    return num2words(int(num), lang=self.voice_language)
+                    return number_to_words(int(num), self.voice_language)
             except Exception as e:
                 # self.add_sys_message(
                 #     author="_translate_text()",
@@ -1677,8 +2045,7 @@ class MainWindow(QMainWindow):
                 # )
                 return num
 
-        number_pattern = r"-?\d+(?:[.,]\d+)?"
-        converted_text = re.sub(number_pattern, replace_number, text)
+        converted_text = _NUMBER_RE.sub(replace_number, text)
         return converted_text
 
     def process_toxic_message(
@@ -1697,8 +2064,7 @@ class MainWindow(QMainWindow):
             text=f"[{_(self.language, reason)}] {message}",
             color="gray",
         )
-        self.messages_stats["filtered_count"] += 1
-        self.on_change_stats()
+        self.count_stat("filtered_count")
 
         if is_staff is False and is_owner is False:
             self.toxic_dict[platform_author] += 1
@@ -1738,7 +2104,9 @@ class MainWindow(QMainWindow):
         msg_id = str(msg_id)
         if msg_id in self.processed_messages:
             return
-        self.processed_messages.add(msg_id)
+        self.processed_messages[msg_id] = None
+        if len(self.processed_messages) > MAX_PROCESSED_MESSAGES:
+            self.processed_messages.popitem(last=False)
 
         if self.contains_stop_words(cleaned_text):
             self.process_toxic_message(
@@ -1751,31 +2119,99 @@ class MainWindow(QMainWindow):
             )
             return
 
-        if self.detox_model:
-            sentiment = self.detox_model.predict(cleaned_text)
-            detox_key = max(sentiment, key=sentiment.get)
-            detox_value = sentiment[detox_key]
-            if detox_value > self.toxic_sense:
-                self.process_toxic_message(
-                    platform=platform,
-                    author=cleaned_author,
-                    message=clean_message,
-                    reason=str(detox_key).replace("_", " ").capitalize(),
-                    is_staff=is_staff,
-                    is_owner=is_owner,
+        # Too short to be spoken even after translation, so it only gets
+        # the toxicity check and is logged as is
+        growth = TRANSLATION_GROWTH if self.auto_translate else 1
+        too_short = len(cleaned_text) * growth < self.min_msg_length
+
+        # Toxicity is checked in batches by the message buffer worker. A burst
+        # it cannot keep up with is logged unchecked and not spoken, instead
+        # of growing the buffer and the speech delay
+        try:
+            self.msg_buffer.put_nowait(
+                (platform, cleaned_author, cleaned_text, is_staff, is_owner, too_short)
+            )
+        except Full:
+            self.count_stat("dropped_count")
+            self.add_message(
+                platform=platform,
+                author=cleaned_author,
+                text=f"[{_(self.language, "Unchecked")}] {cleaned_text}",
+                color="gray",
+            )
+
+    def process_msg_buffer_loop(self):
+        """Check buffered chat messages for toxicity in batches"""
+        while True:
+            batch = [self.msg_buffer.get()]
+            while len(batch) < DETOX_BATCH_SIZE:
+                try:
+                    batch.append(self.msg_buffer.get_nowait())
+                except Empty:
+                    break
+
+            try:
+                self.process_message_batch(batch)
+            except Exception as e:
+                self.add_sys_error(
+                    author="process_msg_buffer_loop()",
+                    text=_(self.language, "Message processing error"),
+                    error=e,
                 )
-                return
+
+    def process_message_batch(self, batch):
+        passed = []
+        detox_model = self.detox_model
+        if detox_model:
+            results = detox_model.predict([item[2] for item in batch])
+        for index, item in enumerate(batch):
+            platform, author, text, is_staff, is_owner, too_short = item
+            if detox_model:
+                sentiment = {key: values[index] for key, values in results.items()}
+                detox_key = max(sentiment, key=sentiment.get)
+                if sentiment[detox_key] > self.toxic_sense:
+                    self.process_toxic_message(
+                        platform=platform,
+                        author=author,
+                        message=text,
+                        reason=str(detox_key).replace("_", " ").capitalize(),
+                        is_staff=is_staff,
+                        is_owner=is_owner,
+                    )
+                    continue
+            passed.append((platform, author, text, too_short))
 
         if self.auto_translate:
-            cleaned_text = translate_text(cleaned_text, self.voice_language)
-            cleaned_text = clean_message(cleaned_text, self.language)
-            if not cleaned_text:
-                return
+            pending = [index for index, item in enumerate(passed) if not item[3]]
+            if pending:
+                translated = translate_texts(
+                    [passed[index][2] for index in pending], self.voice_language
+                )
+                for index, text in zip(pending, translated):
+                    platform, author, _text, too_short = passed[index]
+                    passed[index] = (
+                        platform,
+                        author,
+                        clean_message(text, self.language),
+                        too_short,
+                    )
+
+        for platform, author, text, too_short in passed:
+            if not text:
+                continue
+            if too_short:
+                self.add_message(platform=platform, author=author, text=text)
+            else:
+                self.speak_chat_message(platform, author, text)
 
+    def speak_chat_message(self, platform, cleaned_author, cleaned_text):
         self.add_message(platform=platform, author=cleaned_author, text=cleaned_text)
 
         if len(cleaned_text) < self.min_msg_length:
             return
+        # The TTS queue would reject it, so skip building the spoken text
+        if self.tts_queue.full():
+            return
         if len(cleaned_text) > self.max_msg_length:
             cleaned_text = cleaned_text[: self.max_msg_length] + "..."
 
@@ -1783,41 +2219,72 @@ class MainWindow(QMainWindow):
         cleaned_text = self.convert_numbers_to_words(cleaned_text)
 
         if self.read_author_names:
-            cleaned_text = f"{transliteration(cleaned_author, self.voice_language)} {_(self.voice_language, 'said')} - {cleaned_text}"
+            cleaned_text = f"{transliteration(cleaned_author, self.voice_language)} {self._said_phrase} - {cleaned_text}"
 
         if self.read_platform_names:
-            cleaned_text = f"{_(self.voice_language, "Message from")} {_(self.voice_language, str(platform).lower())}: {cleaned_text}"
+            platform_phrase = self._platform_phrases.get(platform) or _(
+                self.voice_language, str(platform).lower()
+            )
+            cleaned_text = f"{self._message_from_phrase} {platform_phrase}: {cleaned_text}"
 
         self.speak(cleaned_text)
 
     # == Audio processing ==
 
-    def text_to_speech(self, text):
+    def pick_voice(self):
+        """Concrete speaker for the next message, drawn when the voice is random"""
+        if self.voice == "random":
+            num = randint(0, len(VOICES[self.voice_language]) - 1)
+            return VOICES[self.voice_language][num]
+        return self.voice
+
+    def text_to_speech(self, text, voice):
         """Convert text to speech using Silero"""
         try:
             if self.model is not None:
                 with self.model_lock:
-                    with no_grad():
-                        if self.voice == "random":
-                            num = randint(0, len(VOICES[self.voice_language]) - 1)
-                            voice = VOICES[self.voice_language][num]
-                        else:
-                            voice = self.voice
-
+                    with inference_mode():
                         return self.model.apply_tts(
                             text=text,
                             speaker=voice,
-                            # sample_rate=self.sample_rate,
+                            sample_rate=SAMPLE_RATE,
                             put_accent=self.add_accents,
                             # put_yo=self.put_yo,
                         )
         except Exception as e:
-            self.add_sys_message(
+            self.add_sys_error(
                 author="text_to_speech()",
-                text=f"{_(self.language, "Error convert text to speech")}, {translate_text(str(e), self.language)}. TEXT: {text}",
-                status="error",
+                text=_(self.language, "Error convert text to speech"),
+                error=e,
+                detail=f". TEXT: {text}",
             )
 
+    def cached_text_to_speech(self, text):
+        """Silero output as float32, reused for repeated texts"""
+        # Keyed on the drawn speaker so "random" still varies between repeats
+        voice = self.pick_voice()
+        key = (self.voice_language, voice, self.add_accents, text)
+        audio = self._tts_cache.get(key)
+        if audio is not None:
+            self._tts_cache.move_to_end(key)
+            # postprocess_audio scales in place, so hand out a copy
+            return audio.copy()
+
+        audio = self.text_to_speech(text, voice)
+        if audio is None:
+            return None
+        if hasattr(audio, "cpu"):
+            audio = audio.cpu().numpy()
+        audio = np.asarray(audio, dtype=np.float32)
+
+        if len(text) <= TTS_CACHE_MAX_TEXT:
+            self._tts_cache[key] = audio.copy()
+            self._tts_cache_bytes += audio.nbytes
+            while self._tts_cache_bytes > TTS_CACHE_BYTES:
+                _key, evicted = self._tts_cache.popitem(last=False)
+                self._tts_cache_bytes -= evicted.nbytes
+        return audio
+
     def postprocess_audio(self, audio):
         """Postprocess audio: convert to numpy, normalize, apply volume and speed"""
         try:
@@ -1831,83 +2298,92 @@ class MainWindow(QMainWindow):
         if audio.size == 0:
             return audio
 
-        max_abs = float(np.max(np.abs(audio))) if np.any(np.abs(audio)) else 1.0
-        if max_abs == 0:
-            max_abs = 1.0
-        audio = audio / max_abs
-
-        # Apply volume (single scaling)
-        audio = audio * (self.volume / 100.0)
+        # Normalize peak and apply volume with one in-place multiply
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        max_abs = max(float(audio.max()), -float(audio.min())) or 1.0
+        np.multiply(audio, (self.volume / 100.0) / max_abs, out=audio)
 
         if self.speech_rate != 1.0:
-            num_samples = max(1, int(len(audio) / self.speech_rate))
-            audio = resample(audio, num_samples)
+            ratio = Fraction(1 / self.speech_rate).limit_denominator(100)
+            audio = resample_poly(audio, ratio.numerator, ratio.denominator).astype(
+                np.float32, copy=False
+            )
 
         return audio
 
     def speak(self, text):
+        """Queue text for the TTS worker"""
+        try:
+            self.tts_queue.put_nowait(text)
+            return True
+        except Full:
+            return False
+
+    def synthesize(self, text):
         """Main TTS method"""
         try:
-            audio = self.text_to_speech(text)
+            audio = self.cached_text_to_speech(text)
             if audio is None:
                 return False
             audio_numpy = self.postprocess_audio(audio)
             if len(audio_numpy) > 0:
-                self.audio_queue.put(audio_numpy, timeout=2.0)
+                # Blocks while playback is behind, so TTS stays ahead by the queue depth
+                self.audio_queue.put(audio_numpy)
                 return True
             return False
-        except Full:
-            return False
         except Exception as e:
-            self.add_sys_message(
-                author="speak()",
-                text=f"{_(self.language, "Audio playback error")}. {translate_text(str(e), self.language)}",
-                status="error",
+            self.add_sys_error(
+                author="synthesize()",
+                text=_(self.language, "Audio playback error"),
+                error=e,
             )
             return False
 
     def play_audio(self, audio_to_play):
         try:
             self._set_audio_indicator("🔴")
-            sd.play(audio_to_play)
-            sd.wait()
+            self.audio_player.play(audio_to_play)
         except Exception as e:
-            self.add_sys_message(
+            self.add_sys_error(
                 author="play_audio()",
-                text=f"{_(self.language, 'Audio playback error')}. {translate_text(str(e), self.language)}",
-                status="error",
+                text=_(self.language, "Audio playback error"),
+                error=e,
             )
         finally:
             self._set_audio_indicator("🟢")
 
+    def process_tts_loop(self):
+        """Synthesize queued texts while the previous audio is playing"""
+        while True:
+            self.synthesize(self.tts_queue.get())
+
     def process_audio_loop(self):
         """Main loop to process audio queue"""
         while True:
             played_message = False
             try:
-                if self.is_paused:
-                    sleep(0.1)
-                    continue
-
-                try:
-                    audio_data = self.audio_queue.get(timeout=0.2)
-                except Empty:
+                # Block until there is audio and playback is not paused
+                audio_data = self.audio_queue.get()
+                generation = self._clear_generation
+                self._audio_on_hold = True
+                self.playback_allowed.wait()
+                self._audio_on_hold = False
+                if generation != self._clear_generation:
+                    # Cleared while this clip waited for the pause to end
                     continue
 
                 self.play_audio(audio_data)
                 played_message = True
 
                 del audio_data
-                gc.collect()
 
-                self.messages_stats["spoken_count"] += 1
-                self.on_change_stats()
+                self.count_stat("spoken_count")
 
             except Exception as e:
-                self.add_sys_message(
+                self.add_sys_error(
                     author="process_audio_loop()",
-                    text=f"{_(self.language, "Audio queue error")}. {translate_text(str(e), self.language)}",
-                    status="error",
+                    text=_(self.language, "Audio queue error"),
+                    error=e,
                 )
             if played_message:
                 sleep(self.speech_delay)